@@ -0,0 +1,42 @@
+"""hot query indexes
+
+Revision ID: 3c9f1d2a7e41
+Revises: b5723e7807a2
+Create Date: 2026-10-15 09:00:12.114520+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9f1d2a7e41"
+down_revision: Union[str, Sequence[str], None] = "b5723e7807a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_raster_parcel_metric_date",
+        "raster_stats",
+        ["parcel_id", "metric_type", "acquisition_date"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_alerts_active_parcel_type",
+        "alerts",
+        ["parcel_id", "alert_type"],
+        unique=False,
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_alerts_active_parcel_type", table_name="alerts")
+    op.drop_index("idx_raster_parcel_metric_date", table_name="raster_stats")
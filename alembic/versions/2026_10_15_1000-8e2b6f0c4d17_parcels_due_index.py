@@ -0,0 +1,41 @@
+"""parcels due index
+
+Revision ID: 8e2b6f0c4d17
+Revises: 3c9f1d2a7e41
+Create Date: 2026-10-15 10:00:41.530217+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e2b6f0c4d17"
+down_revision: Union[str, Sequence[str], None] = "3c9f1d2a7e41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY can't run inside a transaction, parcels stays writable meanwhile
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_parcels_due",
+            "parcels",
+            ["next_sync_scheduled_at"],
+            unique=False,
+            postgresql_where=sa.text("is_active AND auto_sync_enabled"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_parcels_due", table_name="parcels", postgresql_concurrently=True
+        )
@@ -0,0 +1,43 @@
+"""backfill latest acquisition date
+
+Revision ID: 5a1d7c3e9b20
+Revises: 8e2b6f0c4d17
+Create Date: 2026-10-15 11:00:12.804113+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5a1d7c3e9b20"
+down_revision: Union[str, Sequence[str], None] = "8e2b6f0c4d17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # the scheduled alert and time series runs read parcels.latest_acquisition_date,
+    # which ingestion never persisted before, set it from the stored raster stats
+    op.execute(
+        sa.text(
+            """
+            UPDATE parcels p
+            SET latest_acquisition_date = (
+                SELECT max(r.acquisition_date)
+                FROM raster_stats r
+                WHERE r.parcel_id = p.uid
+            )
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # data only, the previous values were never maintained
+    pass
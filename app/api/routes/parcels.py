@@ -4,9 +4,15 @@ from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
 from pydantic import ValidationError
 
 from app.api.deps import SessionDep
-from app.crud import find_parcel_by_id, list_parcels
+from app.crud import find_parcel_by_id, find_parcels_by_ids, list_parcels
 from app.models import Parcel
-from app.models.schemas import ParcelCreate, ParcelListResponse, ParcelResponse
+from app.models.schemas import (
+    ParcelBatchRequest,
+    ParcelBatchResponse,
+    ParcelCreate,
+    ParcelListResponse,
+    ParcelResponse,
+)
 from app.utils import (
     trigger_backfill_for_parcel,
 )
@@ -115,6 +121,27 @@ async def get_parcels(
         )
 
 
+@router.post(
+    "/parcels/batch",
+    response_model=ParcelBatchResponse,
+    status_code=200,
+    summary="Get several parcels",
+    description="Get the parcels with the given ids in one request, unknown ids are skipped",
+)
+async def get_parcels_batch(batch: ParcelBatchRequest, db: SessionDep):
+    parcels = find_parcels_by_ids(batch.ids, db)
+    try:
+        return ParcelBatchResponse(
+            parcels=[ParcelResponse.model_validate(p) for p in parcels]
+        )
+    except ValidationError as e:
+        logger.exception(e)
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to serialize parcel data",
+        )
+
+
 @router.get("/{parcel_id}")
 async def get_parcel(parcel_id: str, db: SessionDep):
     parcel = find_parcel_by_id(parcel_id, db)
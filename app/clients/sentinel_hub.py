@@ -1,9 +1,13 @@
 """Sentinel Hub API client for making HTTP requests."""
 
+import hashlib
+import threading
+import time
 from datetime import date
 from typing import Any
 
 import httpx
+import orjson
 
 from .sentinel_hub_auth import sentinel_auth
 
@@ -13,6 +17,10 @@ class SentinelHubClient:
     client for Sentinel Hub API. serve as external api interface
     """
 
+    # identical statistics requests (retries, re-run backfills) are served from memory
+    RESPONSE_CACHE_TTL_SECONDS = 3600
+    RESPONSE_CACHE_MAX_ENTRIES = 128
+
     def __init__(self, base_url: str = "https://services.sentinel-hub.com"):
         """
         Initialize Sentinel Hub client.
@@ -21,6 +29,19 @@ class SentinelHubClient:
             base_url: Sentinel Hub API base URL
         """
         self.base_url = base_url
+        # one pooled client for all requests, so TCP/TLS connections are reused
+        # across calls (and across the ingestion worker threads, httpx.Client is thread safe)
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=60.0,
+            transport=httpx.HTTPTransport(
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+                retries=3,  # connection failures only, not HTTP error responses
+            ),
+        )
+        # request payload hash -> (expires_at, response), shared by the ingestion workers
+        self._response_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
 
     def get_statistics(
         self,
@@ -53,20 +74,53 @@ class SentinelHubClient:
             evalscript=evalscript,
             max_cloud_coverage=max_cloud_coverage,
         )
-        token = sentinel_auth.get_token()
+        # the payload holds everything that determines the response
+        cache_key = hashlib.blake2b(
+            orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
 
-        with httpx.Client(base_url=self.base_url, timeout=60.0) as client:
-            response = client.post(
-                "/api/v1/statistics",
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
-                },
-            )
-            response.raise_for_status()
+        token = sentinel_auth.get_token()
 
-        return response.json()
+        response = self._client.post(
+            "/api/v1/statistics",
+            json=payload,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            },
+        )
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+        self._cache_response(cache_key, data)
+        return data
+
+    def _get_cached_response(self, key: str) -> dict[str, Any] | None:
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at <= time.monotonic():
+                del self._response_cache[key]
+                return None
+            return data
+
+    def _cache_response(self, key: str, data: dict[str, Any]):
+        now = time.monotonic()
+        with self._cache_lock:
+            if len(self._response_cache) >= self.RESPONSE_CACHE_MAX_ENTRIES:
+                # drop expired entries first, then the oldest ones
+                for k in [
+                    k for k, (exp, _) in self._response_cache.items() if exp <= now
+                ]:
+                    del self._response_cache[k]
+                while len(self._response_cache) >= self.RESPONSE_CACHE_MAX_ENTRIES:
+                    del self._response_cache[next(iter(self._response_cache))]
+            self._response_cache[key] = (now + self.RESPONSE_CACHE_TTL_SECONDS, data)
 
     def _build_statistics_payload(
         self,
@@ -1,5 +1,6 @@
 """Sentinel Hub authentication service."""
 
+import threading
 from datetime import UTC, datetime, timedelta
 
 import httpx
@@ -16,6 +17,8 @@ class SentinelHubAuth:
         self.client_secret = config.SENTINEL_HUB_CLIENT_SECRET
         self._token: str | None = None
         self._token_expires_at: datetime | None = None
+        # ingestion workers share this instance, only one of them refreshes the token
+        self._lock = threading.Lock()
 
     def get_token(self) -> str:
         """
@@ -26,12 +29,21 @@ class SentinelHubAuth:
         Returns:
             Valid OAuth2.0 access token
         """
-        if self._token and self._token_expires_at:
-            if datetime.now(UTC) < self._token_expires_at:
-                return self._token
-
-        self._token = self._fetch_new_token()
-        return self._token
+        if self._token_is_valid():
+            return self._token
+
+        with self._lock:
+            # another thread may have refreshed it while we waited for the lock
+            if not self._token_is_valid():
+                self._token = self._fetch_new_token()
+            return self._token
+
+    def _token_is_valid(self) -> bool:
+        return (
+            self._token is not None
+            and self._token_expires_at is not None
+            and datetime.now(UTC) < self._token_expires_at
+        )
 
     def _fetch_new_token(self) -> str:
         """
@@ -22,6 +22,8 @@ class GlobalConfig(BaseConfig):
     ENABLE_SCHEDULER: bool = False
     INGESTION_SHEDULER_INTERVAL_DURATION: dict = {"hours": 24}
     TIMESERIES_SHEDULER_INTERVAL_DURATION: dict = {"hours": 24}
+    # parcels ingested concurrently per scheduler run, keep below the engine pool size
+    INGESTION_MAX_WORKERS: int = 4
     API_BASE_URL: str | None = "http://localhost:8000/api/v1"
     SENTRY_DSN: str | None = None
 
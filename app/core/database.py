@@ -1,9 +1,19 @@
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from .config import config
 
-engine = create_engine(str(config.DATABASE_URL))
+engine = create_engine(
+    str(config.DATABASE_URL),
+    # multi-row VALUES for bulk INSERTs, psycopg2 execute_batch for bulk UPDATEs
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
+    # JSONB columns (raw_metadata, alerts_data, ...) go through orjson
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+)
 
 session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
@@ -11,6 +11,11 @@ def find_parcel_by_id(parcel_id: str, db: SessionDep) -> Parcel:
     return parcel
 
 
+def find_parcels_by_ids(parcel_ids: list[str], db: Session) -> list[Parcel]:
+    stmt = select(Parcel).where(Parcel.uid.in_(parcel_ids))
+    return list(db.execute(stmt).scalars().all())
+
+
 def list_parcels(
     db: Session,
     *,
@@ -41,6 +41,9 @@ async def lifespan(app: FastAPI):
             logger.exception(f"failed stopping scheduler, {str(e)}")
     if time_series_scheduler.is_running():
         time_series_scheduler.stop()
+    # the shared scheduler is shut down once the last job is removed
+    if generate_alerts_scheduler.is_running():
+        generate_alerts_scheduler.stop()
 
 
 app = FastAPI(
@@ -55,4 +55,11 @@ class Alerts(Base):
     __table_args__ = (
         sa.Index("idx_alerts_status", "status"),
         sa.Index("idx_alerts_parcel_status", "parcel_id", "status"),
+        # partial index, only active alerts are looked up before creating new ones
+        sa.Index(
+            "idx_alerts_active_parcel_type",
+            "parcel_id",
+            "alert_type",
+            postgresql_where=sa.text("status = 'active'"),
+        ),
     )
@@ -81,6 +81,15 @@ class Parcel(Base):
         back_populates="parcel", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # partial index matching the scheduler's due parcels query
+        sa.Index(
+            "idx_parcels_due",
+            "next_sync_scheduled_at",
+            postgresql_where=sa.text("is_active AND auto_sync_enabled"),
+        ),
+    )
+
 
 @sa.event.listens_for(Parcel, "before_insert")
 # @sa.event.listens_for(Parcel, "before_update")
@@ -59,4 +59,10 @@ class RasterStats(Base):
             "parcel_id", "acquisition_date", "metric_type", name="uq_parcel_date_index"
         ),
         sa.Index("idx_raster_parcel_date", "parcel_id", "acquisition_date"),
+        sa.Index(
+            "idx_raster_parcel_metric_date",
+            "parcel_id",
+            "metric_type",
+            "acquisition_date",
+        ),
     )
@@ -102,6 +102,14 @@ class ParcelListResponse(BaseModel):
     offset: int
 
 
+class ParcelBatchRequest(BaseModel):
+    ids: Annotated[list[str], Field(min_length=1, max_length=100)]
+
+
+class ParcelBatchResponse(BaseModel):
+    parcels: list[ParcelResponse]
+
+
 class ParcelStatsRequest(BaseModel):
     parcel_id: str
 
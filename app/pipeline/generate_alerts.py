@@ -1,7 +1,7 @@
 import logging
 from datetime import date, timedelta
 
-from sqlalchemy import desc, select
+from sqlalchemy import desc, exists, func, select
 from sqlalchemy.orm import Session
 
 from app.models import Alerts, Parcel, RasterStats, TimeSeries
@@ -22,7 +22,9 @@ class GenerateAlerts:
     def __init__(self, session_factory):
         self.session_factory = session_factory
 
-    def generate_alerts_for_parcel(self, db_session: Session, parcel_id: str) -> int:
+    def generate_alerts_for_parcel(
+        self, db_session: Session, parcel_id: str, today: date | None = None
+    ) -> int:
         """
         Generate all applicable alerts for a parcel.
 
@@ -30,24 +32,48 @@ class GenerateAlerts:
 
         Args:
             parcel_id: Parcel UUID
+            today: Reference date shared by all checks (default: date.today())
 
         Returns:
             Number of new alerts created
         """
+        latest_date = self._get_latest_acquisition_date(db_session, parcel_id)
+        return self._generate_alerts(
+            db_session, parcel_id, today or date.today(), latest_date
+        )
+
+    def _generate_alerts(
+        self,
+        db_session: Session,
+        parcel_id: str,
+        today: date,
+        latest_date: date | None,
+    ) -> int:
+        """Run the alert checks for a parcel whose latest acquisition date is known."""
         logger.info(f"Generating alerts for parcel {parcel_id}")
 
+        cutoff = today - timedelta(days=14)
         created_count = 0
 
-        if self._check_vegetation_decline(db_session, parcel_id):
-            created_count += 1
+        # without any raster stats there is no time series to check either
+        if latest_date is not None:
+            # stale parcels have no fresh weekly time series to compare
+            if latest_date >= cutoff and self._check_vegetation_decline(
+                db_session, parcel_id
+            ):
+                created_count += 1
+            if self._check_drought_stress(db_session, parcel_id):
+                created_count += 1
+            if self._check_anomalies(db_session, parcel_id, cutoff):
+                created_count += 1
 
-        if self._check_drought_stress(db_session, parcel_id):
-            created_count += 1
-        if self._check_anomalies(db_session, parcel_id):
-            created_count += 1
-        if self._check_stale_data(db_session, parcel_id):
+        if self._check_stale_data(db_session, parcel_id, today, latest_date):
             created_count += 1
 
+        if created_count:
+            # single commit for all alerts created for this parcel
+            db_session.commit()
+
         logger.info(f"Created {created_count} alerts for parcel {parcel_id}")
         return created_count
 
@@ -62,19 +88,28 @@ class GenerateAlerts:
         """
         logger.info("Generating alerts for all parcels")
         with self.session_factory() as db_s:
-            stmt = select(Parcel).where(Parcel.is_active.is_(True))
-            parcels = db_s.execute(stmt).scalars().all()
+            # latest_acquisition_date is kept up to date by ingestion,
+            # no need to look up raster stats per parcel
+            stmt = select(Parcel.uid, Parcel.latest_acquisition_date).where(
+                Parcel.is_active.is_(True)
+            )
+            parcels = db_s.execute(stmt).all()
 
             results = {
                 "total_parcels": len(parcels),
                 "alerts_created": 0,
             }
+            # one snapshot of "today" for the whole run
+            today = date.today()
 
             for parcel in parcels:
                 try:
-                    count = self.generate_alerts_for_parcel(db_s, parcel.uid)
+                    count = self._generate_alerts(
+                        db_s, parcel.uid, today, parcel.latest_acquisition_date
+                    )
                     results["alerts_created"] += count
                 except Exception:
+                    db_s.rollback()
                     logger.exception(
                         f"Failed to generate alerts for parcel {parcel.uid}"
                     )
@@ -184,16 +219,18 @@ class GenerateAlerts:
 
         return False
 
-    def _check_anomalies(self, db_session: Session, parcel_id: str) -> bool:
+    def _check_anomalies(
+        self, db_session: Session, parcel_id: str, cutoff: date
+    ) -> bool:
         """
         Check for detected anomalies in time series.
 
-        Alerts if anomaly was detected in recent time series.
+        Alerts if anomaly was detected in recent time series (on or after cutoff).
         """
         stmt = select(TimeSeries).where(
             TimeSeries.parcel_id == parcel_id,
             TimeSeries.is_anomaly.is_(True),
-            TimeSeries.start_date >= date.today() - timedelta(days=14),
+            TimeSeries.start_date >= cutoff,
         )
 
         anomalies = list(db_session.execute(stmt).scalars().all())
@@ -222,22 +259,19 @@ class GenerateAlerts:
 
         return False
 
-    def _check_stale_data(self, db_session: Session, parcel_id: str) -> bool:
+    def _check_stale_data(
+        self,
+        db_session: Session,
+        parcel_id: str,
+        today: date,
+        latest_date: date | None,
+    ) -> bool:
         """
         Check if parcel has missing recent data.
 
         Alerts if no data in last 14 days.
         """
-        stmt = (
-            select(RasterStats)
-            .where(RasterStats.parcel_id == parcel_id)
-            .order_by(desc(RasterStats.acquisition_date))
-            .limit(1)
-        )
-
-        latest = db_session.execute(stmt).scalar_one_or_none()
-
-        if not latest:
+        if latest_date is None:
             if not self._active_alert_exists(db_session, parcel_id, "no_data"):
                 self._create_alert(
                     db_session,
@@ -249,7 +283,10 @@ class GenerateAlerts:
                 )
                 return True
 
-        elif (date.today() - latest.acquisition_date).days > 14:
+            return False
+
+        days_ago = (today - latest_date).days
+        if days_ago > 14:
             if not self._active_alert_exists(db_session, parcel_id, "stale_data"):
                 self._create_alert(
                     db_session,
@@ -257,12 +294,12 @@ class GenerateAlerts:
                     alert_type="stale_data",
                     severity="low",
                     message=(
-                        f"No new satellite data for {(date.today() - latest.acquisition_date).days} days. "
-                        f"Last data: {latest.acquisition_date.isoformat()}."
+                        f"No new satellite data for {days_ago} days. "
+                        f"Last data: {latest_date.isoformat()}."
                     ),
                     metadata={
-                        "last_date": latest.acquisition_date.isoformat(),
-                        "days_ago": (date.today() - latest.acquisition_date).days,
+                        "last_date": latest_date.isoformat(),
+                        "days_ago": days_ago,
                     },
                 )
                 return True
@@ -270,18 +307,31 @@ class GenerateAlerts:
         return False
 
     # helpers
+    def _get_latest_acquisition_date(
+        self, db_session: Session, parcel_id: str
+    ) -> date | None:
+        """Most recent raster stats acquisition date for the parcel, if any."""
+
+        stmt = select(func.max(RasterStats.acquisition_date)).where(
+            RasterStats.parcel_id == parcel_id
+        )
+
+        return db_session.execute(stmt).scalar()
+
     def _active_alert_exists(
         self, db_session: Session, parcel_id: str, alert_type: str
     ) -> bool:
         """Check if active alert of this type already exists."""
 
-        stmt = select(Alerts).where(
-            Alerts.parcel_id == parcel_id,
-            Alerts.alert_type == alert_type,
-            Alerts.status == "active",
+        stmt = select(
+            exists().where(
+                Alerts.parcel_id == parcel_id,
+                Alerts.alert_type == alert_type,
+                Alerts.status == "active",
+            )
         )
 
-        return db_session.execute(stmt).scalar_one_or_none() is not None
+        return db_session.execute(stmt).scalar()
 
     def _create_alert(
         self,
@@ -292,7 +342,7 @@ class GenerateAlerts:
         message: str,
         metadata: dict,
     ):
-        """Create a new alert."""
+        """Create a new alert (committed by the caller)."""
 
         alert = Alerts(
             parcel_id=parcel_id,
@@ -304,6 +354,5 @@ class GenerateAlerts:
         )
 
         db_session.add(alert)
-        db_session.commit()
 
         logger.info(f"Created {severity} alert for parcel {parcel_id}: {alert_type}")
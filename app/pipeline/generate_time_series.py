@@ -1,8 +1,8 @@
 import logging
 from datetime import date, timedelta
-from typing import List
+from typing import Iterable
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Date, Float, Row, and_, cast, exists, func, select
 from sqlalchemy.orm import Session
 
 from app.models import Parcel, RasterStats, TimeSeries
@@ -48,24 +48,16 @@ class GenerateTimeSeries:
         logger.info(
             f"Generating weekly time series for parcel {parcel_id}, metric {metric_type}"
         )
-        raw_stats = self._get_raw_stats(
-            db_session, parcel_id, metric_type, start_date, end_date
+        weekly_means = self._get_period_means(
+            db_session, parcel_id, metric_type, "week", start_date, end_date
         )
 
-        if not raw_stats:
-            logger.warning(f"No raw stats found for parcel {parcel_id}")
-            return 0
-
-        weekly_groups = self._group_by_week(raw_stats)
-
         created_count = 0
         previous_value = None
 
-        for week_start, week_data in sorted(weekly_groups.items()):
+        for week_start, mean_value in weekly_means:
             week_end = week_start + timedelta(days=6)
 
-            # avg for the week
-            mean_value = sum(s.mean_value for s in week_data) / len(week_data)
             # % change from previous week
             change_from_previous = None
             if previous_value is not None:
@@ -80,15 +72,9 @@ class GenerateTimeSeries:
                 mean_value,
                 week_start,
             )
-            exists = self._time_series_exists(
-                db_session,
-                parcel_id,
-                metric_type,
-                "weekly",
-                week_start,
-            )
-
-            if not exists:
+            if not self._time_series_exists(
+                db_session, parcel_id, metric_type, "weekly", week_start
+            ):
                 # Create time series record
                 ts = TimeSeries(
                     parcel_id=parcel_id,
@@ -106,6 +92,10 @@ class GenerateTimeSeries:
 
             previous_value = mean_value
 
+        if previous_value is None:
+            logger.warning(f"No raw stats found for parcel {parcel_id}")
+            return 0
+
         db_session.commit()
 
         logger.info(f"Created {created_count} weekly time series records")
@@ -122,22 +112,19 @@ class GenerateTimeSeries:
         """
         logger.info(f"Generating monthly time series for parcel {parcel_id}")
 
-        raw_stats = self._get_raw_stats(db_session, parcel_id, metric_type)
-
-        if not raw_stats:
-            return 0
-        monthly_groups = self._group_by_month(raw_stats)
+        monthly_means = self._get_period_means(
+            db_session, parcel_id, metric_type, "month"
+        )
 
         created_count = 0
         previous_value = None
 
-        for (year, month), month_data in sorted(monthly_groups.items()):
-            month_start = date(year, month, 1)
+        for month_start, mean_value in monthly_means:
+            year, month = month_start.year, month_start.month
             if month == 12:
                 month_end = date(year + 1, 1, 1) - timedelta(days=1)
             else:
                 month_end = date(year, month + 1, 1) - timedelta(days=1)
-            mean_value = sum(s.mean_value for s in month_data) / len(month_data)
 
             change_from_previous = None
             if previous_value is not None:
@@ -172,6 +159,9 @@ class GenerateTimeSeries:
 
             previous_value = mean_value
 
+        if previous_value is None:
+            return 0
+
         db_session.commit()
 
         logger.info(f"Created {created_count} monthly time series records")
@@ -188,8 +178,15 @@ class GenerateTimeSeries:
         """
         logger.info("Processing time series for all parcels")
         with self.session_factory() as db_s:
-            stmt = select(Parcel).where(Parcel.is_active.is_(True))
-            parcels = db_s.execute(stmt).scalars().all()
+            # one query for what every parcel needs: its latest raster date
+            # (kept up to date by ingestion) and its latest stored periods
+            stmt = select(
+                Parcel.uid,
+                Parcel.latest_acquisition_date,
+                self._latest_period_start("weekly").label("latest_week"),
+                self._latest_period_start("monthly").label("latest_month"),
+            ).where(Parcel.is_active.is_(True))
+            parcels = db_s.execute(stmt).all()
             results = {
                 "total_parcels": len(parcels),
                 "succeeded": 0,
@@ -199,14 +196,31 @@ class GenerateTimeSeries:
             }
 
             for parcel in parcels:
+                latest = parcel.latest_acquisition_date
                 try:
-                    weekly = self.generate_weekly_time_series(db_s, parcel.uid)
-                    results["weekly_created"] += weekly
-                    monthly = self.generate_monthly_time_series(db_s, parcel.uid)
-                    results["monthly_created"] += monthly
+                    # periods are created in order, so once the period holding the
+                    # latest raster date exists there is nothing new to add
+                    if latest is not None:
+                        week_start = latest - timedelta(days=latest.weekday())
+                        if (
+                            parcel.latest_week is None
+                            or parcel.latest_week < week_start
+                        ):
+                            weekly = self.generate_weekly_time_series(db_s, parcel.uid)
+                            results["weekly_created"] += weekly
+                        month_start = latest.replace(day=1)
+                        if (
+                            parcel.latest_month is None
+                            or parcel.latest_month < month_start
+                        ):
+                            monthly = self.generate_monthly_time_series(
+                                db_s, parcel.uid
+                            )
+                            results["monthly_created"] += monthly
                     results["succeeded"] += 1
 
                 except Exception:
+                    db_s.rollback()
                     logger.exception(
                         f"Failed to process time series for parcel {parcel.uid}"
                     )
@@ -221,15 +235,27 @@ class GenerateTimeSeries:
             return results
 
     # helpers
-    def _get_raw_stats(
+    def _get_period_means(
         self,
         db_session: Session,
         parcel_id: str,
         metric_type: str,
+        period: str,
         start_date: date | None = None,
         end_date: date | None = None,
-    ) -> List[RasterStats]:
-        """Get raw statistics for a given parcel, metric/index type with optional date ranges."""
+    ) -> Iterable[Row]:
+        """
+        Average raw statistics per week or month, aggregated by Postgres.
+
+        Only one row per period is sent back instead of every raw stat.
+        Weeks start on Monday (date_trunc('week') follows ISO weeks).
+
+        Args:
+            period: "week" or "month"
+
+        Returns:
+            (period_start, mean_value) rows, ordered by period_start
+        """
 
         conditions = [
             RasterStats.parcel_id == parcel_id,
@@ -239,55 +265,33 @@ class GenerateTimeSeries:
             conditions.append(RasterStats.acquisition_date >= start_date)
         if end_date:
             conditions.append(RasterStats.acquisition_date <= end_date)
+
+        period_start = cast(
+            func.date_trunc(period, RasterStats.acquisition_date), Date
+        ).label("period_start")
         stmt = (
-            select(RasterStats)
+            select(
+                period_start,
+                cast(func.avg(RasterStats.mean_value), Float).label("mean_value"),
+            )
             .where(and_(*conditions))
-            .order_by(RasterStats.acquisition_date)
+            .group_by(period_start)
+            .order_by(period_start)
         )
 
-        return list(db_session.execute(stmt).scalars().all())
-
-    def _group_by_week(self, stats: List[RasterStats]) -> dict[date, List[RasterStats]]:
-        """
-        Group stats by week (Monday as start of week).
-
-        Returns:
-            Dict mapping week_start_date -> list of stats in that week
-        """
-        weeks = {}
-
-        for stat in stats:
-            week_start_dt = stat.acquisition_date - timedelta(
-                days=stat.acquisition_date.weekday()
-            )  # zero based weekdays , isoweekday for 1 based!
-
-            if week_start_dt not in weeks:
-                weeks[week_start_dt] = []
-
-            weeks[week_start_dt].append(stat)
-
-        return weeks
+        return db_session.execute(stmt)
 
-    def _group_by_month(
-        self, stats: List[RasterStats]
-    ) -> dict[tuple[int, int], List[RasterStats]]:
-        """
-        Group stats by month.
-
-        Returns:
-            Dict mapping (year, month) -> list of stats in that month
-        """
-        months = {}
-
-        for stat in stats:
-            key = (stat.acquisition_date.year, stat.acquisition_date.month)
-
-            if key not in months:
-                months[key] = []
-
-            months[key].append(stat)
-
-        return months
+    def _latest_period_start(self, time_period: str):
+        """Correlated subquery, latest NDVI time series start_date of the outer parcel."""
+        return (
+            select(func.max(TimeSeries.start_date))
+            .where(
+                TimeSeries.parcel_id == Parcel.uid,
+                TimeSeries.metric_type == "NDVI_avg",
+                TimeSeries.time_period == time_period,
+            )
+            .scalar_subquery()
+        )
 
     def _is_anomaly(
         self,
@@ -355,11 +359,13 @@ class GenerateTimeSeries:
     ) -> bool:
         """Check if time series record already exists."""
 
-        stmt = select(TimeSeries).where(
-            TimeSeries.parcel_id == parcel_id,
-            TimeSeries.metric_type == f"{metric_type}_avg",
-            TimeSeries.time_period == time_period,
-            TimeSeries.start_date == start_date,
+        stmt = select(
+            exists().where(
+                TimeSeries.parcel_id == parcel_id,
+                TimeSeries.metric_type == f"{metric_type}_avg",
+                TimeSeries.time_period == time_period,
+                TimeSeries.start_date == start_date,
+            )
         )
 
-        return db_session.execute(stmt).scalar_one_or_none() is not None
+        return db_session.execute(stmt).scalar()
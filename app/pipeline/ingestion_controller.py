@@ -3,10 +3,12 @@ Trigger and manage ingestion jobs for parcels.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, date, datetime, timedelta
-from typing import List
+from typing import Any, List
 
-from sqlalchemy import and_, select
+import orjson
+from sqlalchemy import Result, Row, and_, func, select, update
 from sqlalchemy.orm import Session
 
 from app.models import DataSource, IngestionJob, Parcel
@@ -28,9 +30,12 @@ class IngestionController:
     - Execute jobs through Ingestion
     """
 
-    def __init__(self, session_factory):
+    def __init__(self, session_factory, max_workers: int = 4):
         self.session_factory = session_factory
         self.ingestion_engine = IngestionEngine(self.session_factory)
+        # parcels processed concurrently, bounded by Sentinel Hub rate limits
+        # and the engine connection pool
+        self.max_workers = max_workers
 
     def trigger_initial_backfill(
         self, parcel_id: str, lookback_days: int = 90
@@ -51,8 +56,11 @@ class IngestionController:
             ValueError: If parcel not found
         """
         with self.session_factory() as db_s:
-            parcel = db_s.get(Parcel, parcel_id)
-            if parcel is None:
+            # only the name is needed here, not the whole parcel and its geometry
+            parcel_name = db_s.scalar(
+                select(Parcel.name).where(Parcel.uid == parcel_id)
+            )
+            if parcel_name is None:
                 raise ValueError(f"parcel with {parcel_id} not found")
             data_source = self._get_active_data_source(db_s)
             safe_end_dt = self._calculate_safe_end_date(data_source)
@@ -65,9 +73,8 @@ class IngestionController:
                 job_type="backfill",
                 data_source_id=data_source.uid,
             )
+            # inserted by ingest_with_job_tracking, together with its running status
             db_s.add(job)
-            db_s.commit()
-            logger.info(f"Created backfill job {job.uid}")
 
             # Execute job
             try:
@@ -75,7 +82,7 @@ class IngestionController:
                     db_s, job
                 )
                 logger.info(
-                    f"Backfill completed for {parcel.name}: "
+                    f"Backfill completed for {parcel_name}: "
                     f"{completed_job.records_created} records created"
                 )
                 return completed_job
@@ -94,107 +101,149 @@ class IngestionController:
         """
         logger.info("Starting scheduled ingestion check")
 
-        with self.session_factory() as db_s:
-            due_parcels = self._get_due_parcels(db_s)
-
-            due_parcels_len = len(due_parcels)
-            logger.info(f"Found {due_parcels_len} parcels due for ingestion")
-
-            results = {
-                "total": due_parcels_len,
-                "succeeded": 0,
-                "failed": 0,
-                "skipped": 0,
-            }
-
-            for parcel in due_parcels:
+        results = {
+            "total": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "skipped": 0,
+        }
+
+        # succeeded and up-to-date parcels, rescheduled together once all are done
+        to_reschedule = []
+
+        # each parcel is dominated by the Sentinel Hub call, run them in a thread pool
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            with self.session_factory() as db_s:
+                # same data source for every parcel in this run, only read from here on
+                data_source = self._get_active_data_source(db_s)
+                # parcels are submitted as they are streamed in
+                for parcel in self._get_due_parcels(db_s, data_source):
+                    future = executor.submit(
+                        self._process_single_parcel,
+                        parcel,
+                        data_source,
+                        orjson.loads(parcel.geojson),
+                    )
+                    futures[future] = parcel.uid
+
+            results["total"] = len(futures)
+            logger.info(f"Found {results['total']} parcels due for ingestion")
+
+            for future in as_completed(futures):
                 try:
-                    self._process_single_parcel(db_s, parcel)
+                    future.result()
                     results["succeeded"] += 1
+                    to_reschedule.append(futures[future])
 
                 except UpToDateError:
                     results["skipped"] += 1
+                    to_reschedule.append(futures[future])
 
                 except Exception:
-                    logger.exception(f"Failed to process parcel {parcel.uid}")
+                    logger.exception(f"Failed to process parcel {futures[future]}")
                     results["failed"] += 1
 
-            logger.info(
-                f"Scheduled ingestion complete: "
-                f"{results['succeeded']} succeeded, "
-                f"{results['failed']} failed, "
-                f"{results['skipped']} skipped"
-            )
+        if to_reschedule:
+            with self.session_factory() as db_s:
+                self._schedule_next_sync(db_s, to_reschedule, data_source)
+                db_s.commit()
+
+        logger.info(
+            f"Scheduled ingestion complete: "
+            f"{results['succeeded']} succeeded, "
+            f"{results['failed']} failed, "
+            f"{results['skipped']} skipped"
+        )
 
-            return results
+        return results
 
-    def _get_due_parcels(self, db_s: Session) -> List[Parcel]:
+    def _get_due_parcels(self, db_s: Session, data_source: DataSource) -> Result:
         """
-        Get list of parcels that need ingestion.
+        Get parcels that need ingestion.
 
         Returns parcels where:
         - Active and sync enabled
         - Next sync time is in the past (or null for new parcels)
+        - New data can be available (no data yet, or latest date before safe end date)
+
+        Only the columns the scheduler uses are loaded, not the whole parcel,
+        with the boundary already converted to GeoJSON by PostGIS.
 
         Returns:
-            List of Parcel instances
+            (uid, name, latest_acquisition_date, geojson) rows, streamed in batches of 200
         """
         now = datetime.now(UTC)
-        stmt = select(Parcel).where(
-            and_(
-                Parcel.is_active,
-                Parcel.auto_sync_enabled,
-                (Parcel.next_sync_scheduled_at <= now)
-                | (Parcel.next_sync_scheduled_at.is_(None)),
+        # same rule as _determine_fetch_window, up-to-date parcels are never returned
+        safe_end_dt = self._calculate_safe_end_date(data_source)
+        stmt = (
+            select(
+                Parcel.uid,
+                Parcel.name,
+                Parcel.latest_acquisition_date,
+                func.ST_AsGeoJSON(Parcel.geometry).label("geojson"),
             )
+            .where(
+                and_(
+                    Parcel.is_active,
+                    Parcel.auto_sync_enabled,
+                    (Parcel.next_sync_scheduled_at <= now)
+                    | (Parcel.next_sync_scheduled_at.is_(None)),
+                    (Parcel.latest_acquisition_date < safe_end_dt)
+                    | (Parcel.latest_acquisition_date.is_(None)),
+                )
+            )
+            .execution_options(yield_per=200)
         )
 
-        return list(db_s.execute(stmt).scalars().all())
+        return db_s.execute(stmt)
 
-    def _process_single_parcel(self, db_s: Session, parcel: Parcel):
+    def _process_single_parcel(
+        self, parcel: Row, data_source: DataSource, geometry: dict[str, Any]
+    ):
         """
         Process ingestion for a single parcel.
 
-        Creates a job and executes it.
+        Creates a job and executes it. Runs in a worker thread, so it uses its own session.
 
         Args:
-            parcel: Parcel to process
+            parcel: (uid, name, latest_acquisition_date) row of the parcel to process
+            data_source: Active DataSource, looked up once per run
+            geometry: Parcel boundary as GeoJSON, fetched with the due parcels
 
         Raises:
             UpToDateError: If parcel is already current
         """
-
-        try:
-            data_source = self._get_active_data_source(db_s)
-            start_dt, end_dt = self._determine_fetch_window(parcel, data_source)
-            logger.info(
-                f"Processing parcel {parcel.uid} ({parcel.name}) from data_source {data_source.name}"
-            )
-        except UpToDateError as e:
-            logger.info(str(e))
-            # Schedule next check
-            self._schedule_next_sync(parcel, data_source)
-            raise
-        job = IngestionJob(
-            parcel_id=parcel.uid,
-            requested_start_date=start_dt,
-            requested_end_date=end_dt,
-            job_type="periodic",
-            data_source_id=data_source.uid,
-        )
-        db_s.add(job)
-        db_s.commit()
-        try:
-            completed_job = self.ingestion_engine.ingest_with_job_tracking(db_s, job)
-            self._schedule_next_sync(db_s, parcel, data_source)
-
-            logger.info(
-                f"Processed {parcel.name}: {completed_job.records_created} records"
+        with self.session_factory() as db_s:
+            try:
+                start_dt, end_dt = self._determine_fetch_window(parcel, data_source)
+                logger.info(
+                    f"Processing parcel {parcel.uid} ({parcel.name}) from data_source {data_source.name}"
+                )
+            except UpToDateError as e:
+                logger.info(str(e))
+                raise
+            job = IngestionJob(
+                parcel_id=parcel.uid,
+                requested_start_date=start_dt,
+                requested_end_date=end_dt,
+                job_type="periodic",
+                data_source_id=data_source.uid,
             )
+            # inserted by ingest_with_job_tracking, together with its running status
+            db_s.add(job)
+            try:
+                completed_job = self.ingestion_engine.ingest_with_job_tracking(
+                    db_s, job, geometry
+                )
 
-        except Exception:
-            logger.exception(f"Failed to process parcel {parcel.uid}")
-            raise
+                logger.info(
+                    f"Processed {parcel.name}: {completed_job.records_created} records"
+                )
+
+            except Exception:
+                logger.exception(f"Failed to process parcel {parcel.uid}")
+                raise
 
     def _get_active_data_source(
         self, db_s, data_source_name: str = "sentinel-2-l2a"
@@ -234,14 +283,17 @@ class IngestionController:
         safe_end_date = today - timedelta(days=data_source.availability_lag_days)
 
         logger.debug(
-            f"Calculated safe end date: {safe_end_date} "
-            f"(today={today}, lag={data_source.availability_lag_days} for {data_source.name})"
+            "Calculated safe end date: %s (today=%s, lag=%s for %s)",
+            safe_end_date,
+            today,
+            data_source.availability_lag_days,
+            data_source.name,
         )
 
         return safe_end_date
 
     def _determine_fetch_window(
-        self, parcel: Parcel, data_source: DataSource
+        self, parcel: Row, data_source: DataSource
     ) -> tuple[date, date]:
         """
         Determine what date range to fetch for a parcel.
@@ -251,7 +303,7 @@ class IngestionController:
         3. If already up-to-date, raise UpToDateError
 
         Args:
-            parcel: Parcel to fetch data for
+            parcel: Parcel row (uid, latest_acquisition_date) to fetch data for
             data_source: DataSource configuration
 
         Returns:
@@ -279,15 +331,21 @@ class IngestionController:
         return start_dt, safe_end_dt
 
     def _schedule_next_sync(
-        self, db_s: Session, parcel: Parcel, data_source: DataSource
+        self, db_s: Session, parcel_ids: List[str], data_source: DataSource
     ):
         """
-        Schedule the next sync time for a parcel.
+        Schedule the next sync time for parcels, in a single UPDATE.
 
         Args:
-            parcel: Parcel to schedule
+            parcel_ids: UUIDs of the parcels to schedule
             data_source: DataSource configuration
         """
         next_sync = datetime.now(UTC) + timedelta(days=data_source.sync_frequency_days)
-        parcel.next_sync_scheduled_at = next_sync
-        logger.debug(f"Scheduled next sync for {parcel.uid} at {next_sync}")
+        db_s.execute(
+            update(Parcel)
+            .where(Parcel.uid.in_(parcel_ids))
+            .values(next_sync_scheduled_at=next_sync)
+        )
+        logger.debug(
+            "Scheduled next sync for %s parcels at %s", len(parcel_ids), next_sync
+        )
@@ -4,10 +4,11 @@ ingesting satellite NDVI data into the database.
 
 import logging
 from datetime import UTC, date, datetime
-from typing import Any
+from typing import Any, Iterable
 
-from geoalchemy2.shape import to_shape
-from sqlalchemy import select
+import orjson
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.clients.sentinel_hub import sentinel_client
@@ -25,74 +26,94 @@ class IngestionEngine:
     def __init__(self, session_factory):
         self.session_factory = session_factory
 
-    def ingest_with_job_tracking(self, db_s: Session, job: IngestionJob):
-        logger.info(f"starting ingestion for parcel with id {job.parcel_id}")
+    def ingest_with_job_tracking(
+        self,
+        db_s: Session,
+        job: IngestionJob,
+        geometry: dict[str, Any] | None = None,
+    ):
         job.status = "running"
         job.started_at = datetime.now(UTC)
+        # a new job is inserted straight as running, no separate status update
+        db_s.flush()
+        logger.info(
+            f"starting ingestion job {job.uid} for parcel with id {job.parcel_id}"
+        )
         db_s.commit()
         try:
-            parcel_boundary_geojson_obj = self.get_parcel_geometry(job.parcel_id)
+            # batch callers pass the geometry they already fetched
+            parcel_boundary_geojson_obj = geometry or self.get_parcel_geometry(
+                db_s, job.parcel_id
+            )
             response = sentinel_client.get_statistics(
                 parcel_boundary_geojson_obj,
                 job.requested_start_date,
                 job.requested_end_date,
                 NDVI_EVALSCRIPT,
             )
-            created, skipped, acquisition_dates = 0, 0, []
+            existing_dates = self._get_existing_dates(db_s, job)
+            rows, skipped = [], 0
             for interval_data in response.get("data", []):
                 try:
                     acq_date = self.parse_acquisition_date(
                         interval_data["interval"]["from"]
                     )
-                    stats = self.extract_stats(interval_data)
-                    already_exists = self.record_exists(
-                        db_s, job.parcel_id, acq_date, job.metric_type
-                    )
-                    if already_exists:
+                    if acq_date in existing_dates:
+                        # lazy %-formatting, per interval and usually filtered out
                         logger.debug(
-                            f"Record already exists for {job.parcel_id}"
-                            f"on {acq_date} skiping"
+                            "Record already exists for %s on %s skipping",
+                            job.parcel_id,
+                            acq_date,
                         )
                         skipped += 1
                         continue
-                    self._create_raster_stat(
-                        db_s,
-                        job.parcel_id,
-                        acq_date,
-                        job.metric_type,
-                        job.data_source_id,
-                        stats,
-                        interval_data,
+                    stats = self.extract_stats(interval_data)
+                    rows.append(
+                        self._build_raster_stat_row(
+                            job.parcel_id,
+                            acq_date,
+                            job.metric_type,
+                            job.data_source_id,
+                            stats,
+                            interval_data,
+                        )
                     )
-                    created += 1
-                    acquisition_dates.append(acq_date)
+                    # a date repeated in the response is only inserted once
+                    existing_dates.add(acq_date)
                 except Exception as e:
                     # Logs but continue with other intervals
                     logger.error(
                         f"Failed to process interval for date "
                         f"{interval_data.get('interval', {}).get('from')}: {e}"
                     )
+            # count and date range of the inserted rows in a single pass
+            created, min_date, max_date = 0, None, None
+            for acq_date in self._insert_raster_stats(db_s, rows):
+                created += 1
+                if min_date is None or acq_date < min_date:
+                    min_date = acq_date
+                if max_date is None or acq_date > max_date:
+                    max_date = acq_date
+            # rows stored concurrently since the prefetch hit ON CONFLICT
+            skipped += len(rows) - created
             if created > 0:
                 job.status = "completed"
-                job.actual_start_date = min(acquisition_dates)
-                job.actual_end_date = max(acquisition_dates)
-                db_s.commit()
+                job.actual_start_date = min_date
+                job.actual_end_date = max_date
             elif skipped > 0:
                 job.status = "completed"  # All already existed
-                db_s.commit()
             else:
                 job.status = "partial"  # Requested data not available
-                db_s.commit()
+            if existing_dates:
+                # also when every row already existed, so a parcel whose
+                # latest_acquisition_date was never set gets it on the next sync
+                self._update_parcel_metadata(db_s, job.parcel_id, max(existing_dates))
             job.records_created = created
             job.records_skipped = skipped
             job.completed_at = datetime.now(UTC)
+            # raster stats, job result and parcel metadata land together
             db_s.commit()
 
-            if created > 0:
-                self._update_parcel_metadata(
-                    db_s, job.parcel_id, max(acquisition_dates)
-                )
-
             logger.info(
                 f"Job {job.uid} completed: {created} created, {skipped} skipped"
             )
@@ -100,6 +121,7 @@ class IngestionEngine:
             return job
 
         except Exception as e:
+            db_s.rollback()
             job.status = "failed"
             job.error_message = str(e)
             job.completed_at = datetime.now(UTC)
@@ -109,20 +131,22 @@ class IngestionEngine:
             logger.exception(f"Job {job.uid} failed: {e}")
             raise
 
-    def get_parcel_geometry(self, parcel_id: str) -> dict[str, Any]:
-        with self.session_factory() as db_s:
-            parcel = db_s.get(Parcel, parcel_id)
-        if parcel is None:
+    def get_parcel_geometry(self, db_s: Session, parcel_id: str) -> dict[str, Any]:
+        # Postgres builds the GeoJSON, no WKB -> shapely -> dict round trip
+        stmt = select(Parcel.is_active, func.ST_AsGeoJSON(Parcel.geometry)).where(
+            Parcel.uid == parcel_id
+        )
+        row = db_s.execute(stmt).first()
+        if row is None:
             raise ValueError(f"parcel with id {parcel_id} is not found")
-        if not parcel.is_active:
+        is_active, geojson = row
+        if not is_active:
             raise ValueError(f"parcel with id {parcel_id} is not active")
-        # convert PostGis to shapely
-        polygon_shape = to_shape(parcel.geometry)
-        # convert to geojson
-        return {"type": "Polygon", "coordinates": [list(polygon_shape.exterior.coords)]}
+        return orjson.loads(geojson)
 
     def parse_acquisition_date(self, acq_date: str) -> date:
-        return datetime.fromisoformat(acq_date).date()
+        # Sentinel Hub intervals are "YYYY-MM-DDTHH:MM:SSZ", only the date part is needed
+        return date.fromisoformat(acq_date[:10])
 
     def extract_stats(self, interval_data: dict[str, Any]) -> dict[str, Any]:
         stats = (
@@ -137,28 +161,28 @@ class IngestionEngine:
 
         return stats
 
-    def record_exists(
-        self, db_s: Session, parcel_id: str, acquisition_date: date, metric_type: str
-    ) -> bool:
-        exist_stmt = select(RasterStats).where(
-            RasterStats.acquisition_date == acquisition_date,
-            RasterStats.parcel_id == parcel_id,
-            RasterStats.metric_type == metric_type,
+    def _get_existing_dates(self, db_s: Session, job: IngestionJob) -> set[date]:
+        """Acquisition dates already stored for the job's parcel, metric and window."""
+        stmt = select(RasterStats.acquisition_date).where(
+            RasterStats.parcel_id == job.parcel_id,
+            RasterStats.metric_type == job.metric_type,
+            RasterStats.acquisition_date.between(
+                job.requested_start_date, job.requested_end_date
+            ),
         )
-        return db_s.scalar(exist_stmt) is not None
+        return set(db_s.scalars(stmt))
 
-    def _create_raster_stat(
+    def _build_raster_stat_row(
         self,
-        db_s: Session,
         parcel_id: str,
         acquisition_date: date,
         metric_type: str,
         satellite_source_id: str,
         stats: dict[str, Any],
         raw_metadata: dict[str, Any],
-    ) -> RasterStats:
+    ) -> dict[str, Any]:
         """
-        Create a new raster_stats database record.
+        Build the values for a new raster_stats record.
 
         Args:
             parcel_id: Parcel UUID
@@ -169,25 +193,47 @@ class IngestionEngine:
             raw_metadata: Full interval data for debugging
 
         Returns:
-            Created RasterStats instance (not yet committed)
+            Column values for one RasterStats row
         """
-        raster_stat = RasterStats(
-            parcel_id=parcel_id,
-            acquisition_date=acquisition_date,
-            data_source_id=satellite_source_id,
-            metric_type=metric_type,
-            mean_value=stats["mean"],
-            min_value=stats["min"],
-            max_value=stats["max"],
-            std_dev=stats.get("stDev"),
-            pixel_count=stats.get("sampleCount"),
-            cloud_cover_percent=None,  # Not directly available in stats response
-            raw_metadata=raw_metadata,
-        )
+        return {
+            "parcel_id": parcel_id,
+            "acquisition_date": acquisition_date,
+            "data_source_id": satellite_source_id,
+            "metric_type": metric_type,
+            "mean_value": stats["mean"],
+            "min_value": stats["min"],
+            "max_value": stats["max"],
+            "std_dev": stats.get("stDev"),
+            "pixel_count": stats.get("sampleCount"),
+            "cloud_cover_percent": None,  # Not directly available in stats response
+            "raw_metadata": raw_metadata,
+        }
 
-        db_s.add(raster_stat)
-        db_s.commit()
-        return raster_stat
+    def _insert_raster_stats(
+        self, db_s: Session, rows: list[dict[str, Any]]
+    ) -> Iterable[date]:
+        """
+        Insert raster_stats rows in one statement, skipping already stored ones.
+
+        Existing (parcel_id, acquisition_date, metric_type) rows are left
+        untouched by ON CONFLICT DO NOTHING.
+
+        Args:
+            rows: Values built by _build_raster_stat_row
+
+        Returns:
+            Acquisition dates of the rows actually inserted (not yet committed)
+        """
+        if not rows:
+            return []
+        stmt = (
+            pg_insert(RasterStats)
+            .on_conflict_do_nothing(
+                index_elements=["parcel_id", "acquisition_date", "metric_type"]
+            )
+            .returning(RasterStats.acquisition_date)
+        )
+        return db_s.scalars(stmt, rows)
 
     def _update_parcel_metadata(self, db_s: Session, parcel_id: str, latest_date: date):
         """
@@ -201,19 +247,24 @@ class IngestionEngine:
             parcel_id: Parcel UUID
             latest_date: Most recent acquisition date from this job
         """
-        parcel = db_s.get(Parcel, parcel_id)
-
-        if not parcel:
+        # targeted UPDATE, no need to load the parcel (and its geometry) first
+        stmt = (
+            update(Parcel)
+            .where(Parcel.uid == parcel_id)
+            .values(
+                last_data_synced_at=datetime.now(UTC),
+                # GREATEST ignores NULL, so a first sync just takes latest_date
+                latest_acquisition_date=func.greatest(
+                    Parcel.latest_acquisition_date, latest_date
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if db_s.execute(stmt).rowcount == 0:
             logger.warning(f"Parcel {parcel_id} not found during metadata update")
             return
-        parcel.last_data_synced_at = datetime.now(UTC)
-        # Update latest acquisition date if newer
-        if (
-            parcel.latest_acquisition_date is None
-            or latest_date > parcel.latest_acquisition_date
-        ):
-            parcel.latest_acquisition_date = latest_date
         logger.debug(
-            f"Updated parcel {parcel_id} metadata: "
-            f"latest_acquisition_date={latest_date}"
+            "Updated parcel %s metadata: latest_acquisition_date=%s",
+            parcel_id,
+            latest_date,
         )
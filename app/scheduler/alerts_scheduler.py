@@ -5,12 +5,14 @@ Runs background jobs to process parcels that need data updates.
 """
 
 import logging
+import threading
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.core.database import session_factory
 from app.pipeline.generate_alerts import GenerateAlerts
+from app.scheduler.shared_scheduler import acquire_scheduler, release_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -24,54 +26,53 @@ class GenerateAlertsScheduler:
     - Handle job failures
     """
 
-    def __init__(self, interval_duration: dict = {"weeks": 4}):
+    def __init__(self, interval_duration: dict | None = None):
         self.scheduler: BackgroundScheduler | None = None
         self._is_running = False
-        self.interval_duration = interval_duration
+        self._lock = threading.Lock()
+        self.interval_duration = interval_duration or {"weeks": 4}
+        self.generate_alerts = GenerateAlerts(session_factory)
 
     def start(self, interval: dict | None = None):
-        if self._is_running:
-            logger.warning("Scheduler already running, ignoring start request")
-            return
-
-        logger.info("Starting Alerts scheduler")
-        self.scheduler = BackgroundScheduler(
-            job_defaults={
-                "coalesce": True,
-                "max_instances": 1,
-                "misfire_grace_time": 300,
-            },
-            timezone="UTC",
-        )
-
-        interval_trigger = interval or self.interval_duration
-        self.scheduler.add_job(
-            func=self._process_parcels_job,
-            trigger=IntervalTrigger(**interval_trigger),
-            id="generate_alerts",
-            name="Generate Alerts",
-            replace_existing=True,
-        )
-
-        self.scheduler.start()
-        self._is_running = True
-        interval_name, interval_duration = next(iter(interval_trigger.items()))
-        logger.info(
-            f"Scheduler started - generating alerts for all parcels every {interval_duration} {interval_name}"
-        )
+        with self._lock:
+            if self._is_running:
+                logger.warning("Scheduler already running, ignoring start request")
+                return
+
+            logger.info("Starting Alerts scheduler")
+            # jobs are registered on the scheduler shared with the other pipelines
+            self.scheduler = acquire_scheduler()
+
+            interval_trigger = interval or self.interval_duration
+            self.scheduler.add_job(
+                func=self._process_parcels_job,
+                trigger=IntervalTrigger(**interval_trigger),
+                id="generate_alerts",
+                name="Generate Alerts",
+                replace_existing=True,
+            )
+
+            self._is_running = True
+            interval_name, interval_duration = next(iter(interval_trigger.items()))
+            logger.info(
+                f"Scheduler started - generating alerts for all parcels every {interval_duration} {interval_name}"
+            )
 
     def stop(self):
         """Stop the schedulers."""
-        if not self._is_running or not self.scheduler:
-            logger.warning("Scheduler not running, ignoring stop request")
-            return
+        with self._lock:
+            if not self._is_running or not self.scheduler:
+                logger.warning("Scheduler not running, ignoring stop request")
+                return
 
-        logger.info("Stopping TimeSeries scheduler")
+            logger.info("Stopping TimeSeries scheduler")
 
-        self.scheduler.shutdown(wait=True)
-        self._is_running = False
+            self.scheduler.remove_job("generate_alerts")
+            self.scheduler = None
+            release_scheduler()
+            self._is_running = False
 
-        logger.info("Scheduler stopped")
+            logger.info("Scheduler stopped")
 
     def _process_parcels_job(self):
         """
@@ -83,12 +84,11 @@ class GenerateAlertsScheduler:
         logger.info("Scheduler triggered: checking for due parcels")
 
         try:
-            generate_alerts = GenerateAlerts(session_factory)
-            results = generate_alerts.process_all_parcels()
+            results = self.generate_alerts.process_all_parcels()
 
             logger.info(
-                f"Scheduled job completed: "
-                f"{results['alerts_created']} alerts was created"
+                "Scheduled job completed: %s alerts was created",
+                results["alerts_created"],
             )
         except Exception as e:
             logger.exception(f"Scheduled job failed: {e}")
@@ -101,7 +101,8 @@ class GenerateAlertsScheduler:
         """Get list of scheduled jobs"""
         if not self.scheduler:
             return []
-        return self.scheduler.get_jobs()
+        job = self.scheduler.get_job("generate_alerts")
+        return [job] if job else []
 
 
 generate_alerts_scheduler = GenerateAlertsScheduler()
@@ -5,12 +5,15 @@ Runs background jobs to process parcels that need data updates.
 """
 
 import logging
+import threading
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
+from app.core.config import config
 from app.core.database import session_factory
 from app.pipeline.ingestion_controller import IngestionController
+from app.scheduler.shared_scheduler import acquire_scheduler, release_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -23,54 +26,55 @@ class IngestionScheduler:
     - Schedule periodic parcel processing
     """
 
-    def __init__(self, interval_duration: dict = {"hours": 24}):
+    def __init__(self, interval_duration: dict | None = None):
         self.scheduler: BackgroundScheduler | None = None
         self._is_running = False
-        self.interval_duration = interval_duration
-
-    def start(self, interval: dict | None = None):
-        if self._is_running:
-            logger.warning("Scheduler already running, ignoring start request")
-            return
-
-        logger.info("Starting ingestion scheduler")
-        self.scheduler = BackgroundScheduler(
-            job_defaults={
-                "coalesce": True,  # If missed, run once (not multiple times)
-                "max_instances": 1,
-                "misfire_grace_time": 300,  # 5 minutes grace for missed jobs
-            },
-            timezone="UTC",
+        self._lock = threading.Lock()
+        self.interval_duration = interval_duration or {"hours": 24}
+        self.ingestion_controller = IngestionController(
+            session_factory, max_workers=config.INGESTION_MAX_WORKERS
         )
 
-        interval_trigger = interval or self.interval_duration
-        self.scheduler.add_job(
-            func=self._process_due_parcels_job,
-            trigger=IntervalTrigger(**interval_trigger),
-            id="process_due_parcels",
-            name="Process Due Parcels",
-            replace_existing=True,
-        )
+    def start(self, interval: dict | None = None):
+        with self._lock:
+            if self._is_running:
+                logger.warning("Scheduler already running, ignoring start request")
+                return
+
+            logger.info("Starting ingestion scheduler")
+            # jobs are registered on the scheduler shared with the other pipelines
+            self.scheduler = acquire_scheduler()
+
+            interval_trigger = interval or self.interval_duration
+            self.scheduler.add_job(
+                func=self._process_due_parcels_job,
+                trigger=IntervalTrigger(**interval_trigger),
+                id="process_due_parcels",
+                name="Process Due Parcels",
+                replace_existing=True,
+            )
 
-        self.scheduler.start()
-        self._is_running = True
-        interval_name, interval_duration = next(iter(interval_trigger.items()))
-        logger.info(
-            f"Scheduler started - checking for due parcels every {interval_duration} {interval_name}"
-        )
+            self._is_running = True
+            interval_name, interval_duration = next(iter(interval_trigger.items()))
+            logger.info(
+                f"Scheduler started - checking for due parcels every {interval_duration} {interval_name}"
+            )
 
     def stop(self):
         """Stop the schedulers."""
-        if not self._is_running or not self.scheduler:
-            logger.warning("Scheduler not running, ignoring stop request")
-            return
+        with self._lock:
+            if not self._is_running or not self.scheduler:
+                logger.warning("Scheduler not running, ignoring stop request")
+                return
 
-        logger.info("Stopping ingestion scheduler")
+            logger.info("Stopping ingestion scheduler")
 
-        self.scheduler.shutdown(wait=True)
-        self._is_running = False
+            self.scheduler.remove_job("process_due_parcels")
+            self.scheduler = None
+            release_scheduler()
+            self._is_running = False
 
-        logger.info("Scheduler stopped")
+            logger.info("Scheduler stopped")
 
     def _process_due_parcels_job(self):
         """
@@ -82,14 +86,13 @@ class IngestionScheduler:
         logger.info("Scheduler triggered: checking for due parcels")
 
         try:
-            ingestion_controller = IngestionController(session_factory)
-            results = ingestion_controller.process_due_parcels()
+            results = self.ingestion_controller.process_due_parcels()
 
             logger.info(
-                f"Scheduled job completed: "
-                f"{results['succeeded']} succeeded, "
-                f"{results['failed']} failed, "
-                f"{results['skipped']} skipped"
+                "Scheduled job completed: %s succeeded, %s failed, %s skipped",
+                results["succeeded"],
+                results["failed"],
+                results["skipped"],
             )
 
         except Exception as e:
@@ -103,7 +106,8 @@ class IngestionScheduler:
         """Get list of scheduled jobs (for monitoring)."""
         if not self.scheduler:
             return []
-        return self.scheduler.get_jobs()
+        job = self.scheduler.get_job("process_due_parcels")
+        return [job] if job else []
 
 
 ingestion_scheduler = IngestionScheduler()
@@ -0,0 +1,47 @@
+"""
+APScheduler instance shared by the ingestion, time series and alerts schedulers.
+
+One scheduler thread and one small job executor instead of one set per scheduler.
+"""
+
+import logging
+import threading
+
+from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.schedulers.background import BackgroundScheduler
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_scheduler: BackgroundScheduler | None = None
+
+
+def acquire_scheduler() -> BackgroundScheduler:
+    """Return the shared scheduler, creating and starting it on first use."""
+    global _scheduler
+    with _lock:
+        if _scheduler is None:
+            logger.info("Starting shared background scheduler")
+            _scheduler = BackgroundScheduler(
+                job_defaults={
+                    "coalesce": True,  # If missed, run once (not multiple times)
+                    "max_instances": 1,
+                    "misfire_grace_time": 300,  # 5 minutes grace for missed jobs
+                },
+                # one thread per registered job is enough, each job runs one at a time
+                executors={"default": ThreadPoolExecutor(3)},
+                timezone="UTC",
+            )
+            _scheduler.start()
+        return _scheduler
+
+
+def release_scheduler():
+    """Shut the shared scheduler down once it has no jobs left."""
+    global _scheduler
+    with _lock:
+        if _scheduler is None or _scheduler.get_jobs():
+            return
+        logger.info("Stopping shared background scheduler")
+        _scheduler.shutdown(wait=True)
+        _scheduler = None
@@ -1,5 +1,8 @@
 import logging
+from functools import lru_cache
 
+import numpy as np
+import shapely
 from geoalchemy2.shape import from_shape, to_shape
 from geoalchemy2.types import WKBElement
 from shapely.geometry import Polygon, shape
@@ -9,17 +12,19 @@ from app.pipeline.ingestion_controller import IngestionController
 
 logger = logging.getLogger(__name__)
 
+ingestion_controller = IngestionController(session_factory)
+
 
 def trigger_backfill_for_parcel(parcel_id: str, lookback_days: int = 90):
     logger.info(f"Starting background backfill for parcel with {parcel_id} id")
     try:
-        controller = IngestionController(session_factory)
-        job = controller.trigger_initial_backfill(
+        job = ingestion_controller.trigger_initial_backfill(
             parcel_id, lookback_days=lookback_days
         )
         logger.info(
-            f"Backfill completed for parcel {parcel_id}: "
-            f"{job.records_created} records created"
+            "Backfill completed for parcel %s: %s records created",
+            parcel_id,
+            job.records_created,
         )
     except Exception as e:
         logger.exception(f" Backfill failed for parcel {parcel_id}: {e}")
@@ -34,9 +39,20 @@ def shapely_to_wkbelement(shapely_obj: Polygon, srid: int = 4326) -> WKBElement:
     return from_shape(shapely_obj, srid=srid)
 
 
+@lru_cache(maxsize=4096)
+def _wkb_exterior_coords(wkb_data: bytes | str) -> np.ndarray:
+    """Exterior ring of a WKB polygon, keyed by the WKB itself so it never goes stale."""
+    # one bulk copy out of shapely instead of a python tuple per vertex
+    coords = shapely.get_coordinates(to_shape(WKBElement(wkb_data)).exterior)
+    coords.flags.writeable = False
+    return coords
+
+
 def wkb_to_geojson(wkb_geom: WKBElement) -> dict:
-    polygon = to_shape(wkb_geom)
+    data = wkb_geom.data
+    if isinstance(data, memoryview):
+        data = data.tobytes()  # memoryview is not hashable
     return {
         "type": "Polygon",
-        "coordinates": [list(polygon.exterior.coords)],
+        "coordinates": [_wkb_exterior_coords(data).tolist()],
     }
@@ -1,11 +1,10 @@
 import os
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import text
 from sqlalchemy.orm import Session, sessionmaker
-from starlette.testclient import TestClient
 
 os.environ["ENV_STATE"] = "test"
 from alembic.config import Config
@@ -36,10 +35,17 @@ def db():
 
 @pytest.fixture()
 def db_session(db) -> Generator[Session, None, None]:
+    # checked out from the app engine's pool, no new Postgres connection per test
     connection = engine.connect()
     transaction = connection.begin()
     session_factory = sessionmaker(
-        bind=connection, autocommit=False, autoflush=False, expire_on_commit=False
+        bind=connection,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        # commit/rollback in the code under test only act on a SAVEPOINT,
+        # the outer transaction is rolled back after the test
+        join_transaction_mode="create_savepoint",
     )
     session = session_factory()
     yield session
@@ -48,8 +54,19 @@ def db_session(db) -> Generator[Session, None, None]:
     connection.close()
 
 
+@pytest.fixture(scope="session")
+async def shared_async_client(db) -> AsyncGenerator[AsyncClient, None]:
+    """One client for the whole run, tests only swap the db session it uses."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as c:
+        yield c
+
+
 @pytest.fixture()
-async def async_client(db_session) -> Generator[TestClient, None, None]:
+def async_client(
+    shared_async_client: AsyncClient, db_session: Session
+) -> Generator[AsyncClient, None, None]:
     def overrides_get_db():
         try:
             yield db_session
@@ -57,8 +74,5 @@ async def async_client(db_session) -> Generator[TestClient, None, None]:
             pass
 
     app.dependency_overrides[get_db] = overrides_get_db
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://testserver"
-    ) as c:
-        yield c
+    yield shared_async_client
     app.dependency_overrides.clear()
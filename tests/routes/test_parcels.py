@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from unittest.mock import patch
 
 import pytest
@@ -6,31 +7,46 @@ from httpx import AsyncClient
 api_url_prefix = "/api/v1"
 
 
+DEFAULT_LAT, DEFAULT_LON = -1.949, 30.058
+
+
+def square_geometry(lat: float, lon: float) -> dict:
+    return {
+        "type": "Polygon",
+        "coordinates": [
+            [
+                [lon, lat],
+                [lon + 0.002, lat],
+                [lon + 0.002, lat + 0.002],
+                [lon, lat + 0.002],
+                [lon, lat],
+            ]
+        ],
+    }
+
+
+# built once, payloads only copy it (and rebuild the geometry for other coordinates)
+PARCEL_PAYLOAD_TEMPLATE = MappingProxyType(
+    {
+        "name": "Test Parcel",
+        "geometry": square_geometry(DEFAULT_LAT, DEFAULT_LON),
+        "crop_type": "maize",
+        "soil_type": "clay",
+        "irrigation_type": "rainfed",
+    }
+)
+
+
 def get_parcel_payload(
     name: str = "Test Parcel",
-    lat: float = -1.949,
-    lon: float = 30.058,
+    lat: float = DEFAULT_LAT,
+    lon: float = DEFAULT_LON,
     crop_type: str = "maize",
     **overrides,
 ) -> dict:
-    payload = {
-        "name": name,
-        "geometry": {
-            "type": "Polygon",
-            "coordinates": [
-                [
-                    [lon, lat],
-                    [lon + 0.002, lat],
-                    [lon + 0.002, lat + 0.002],
-                    [lon, lat + 0.002],
-                    [lon, lat],
-                ]
-            ],
-        },
-        "crop_type": crop_type,
-        "soil_type": "clay",
-        "irrigation_type": "rainfed",
-    }
+    payload = {**PARCEL_PAYLOAD_TEMPLATE, "name": name, "crop_type": crop_type}
+    if (lat, lon) != (DEFAULT_LAT, DEFAULT_LON):
+        payload["geometry"] = square_geometry(lat, lon)
     payload.update(overrides)
     return payload
 
@@ -103,6 +119,21 @@ async def test_get_parcel(async_client: AsyncClient, created_parcel: created_par
     assert response.status_code == 200
 
 
+@pytest.mark.anyio
+async def test_get_parcels_batch(async_client: AsyncClient):
+    first = await create_parcel(async_client, name="Batch Parcel One")
+    second = await create_parcel(async_client, name="Batch Parcel Two")
+    response = await async_client.post(
+        f"{api_url_prefix}/parcels/batch",
+        json={"ids": [first["uid"], second["uid"], "unknown-id"]},
+    )
+    assert response.status_code == 200
+    assert {p["uid"] for p in response.json()["parcels"]} == {
+        first["uid"],
+        second["uid"],
+    }
+
+
 @pytest.mark.anyio
 async def test_get_parcel_not_exists(async_client: AsyncClient):
     response = await async_client.get(f"{api_url_prefix}/parcels/12344")
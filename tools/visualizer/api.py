@@ -1,7 +1,11 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
+import numpy as np
+import orjson
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # no need for config
 # root_path = pathlib.Path(__file__).parent.parent.parent.resolve()
@@ -9,62 +13,145 @@ import streamlit as st
 # from app.core.config import config  # noqa: E402
 
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000/api/v1")
+# latest raw stats requested per parcel, the API returns them newest first
+RAW_STATS_LIMIT = 500
+# latest time series periods requested per parcel and period
+TIME_SERIES_LIMIT = 500
+
+
+@st.cache_resource
+def get_client() -> httpx.Client:
+    """One keep-alive client shared by all reruns and sessions of the app."""
+    return httpx.Client(
+        base_url=API_BASE_URL,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    )
+
+
+# reruns within the TTL (search keystrokes, tab switches) reuse the last response,
+# errors are raised out of the cached function so they are never cached
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_parcels() -> tuple[list[dict], dict[str, np.ndarray]]:
+    parcels = _get_json("/parcels", params={"limit": 100}).get("parcels", [])
+    return parcels, _to_columns(parcels)
+
+
+def _to_columns(parcels: list[dict]) -> dict[str, np.ndarray]:
+    """
+    Column arrays of the parcel list, the same order as the list
+
+    Built once per response, so the list metrics and filters are vectorized
+    instead of going through every parcel dict on each rerun.
+    """
+    count = len(parcels)
+    return {
+        "name_lc": np.array(
+            [(p.get("name") or "").lower() for p in parcels], dtype=str
+        ),
+        "area_hectares": np.fromiter(
+            (p.get("area_hectares") or 0.0 for p in parcels), np.float64, count
+        ),
+        "is_active": np.fromiter(
+            (bool(p.get("is_active")) for p in parcels), bool, count
+        ),
+        "has_data": np.fromiter(
+            (bool(p.get("latest_acquisition_date")) for p in parcels), bool, count
+        ),
+    }
 
 
 def fetch_parcels():
+    return fetch_parcels_with_columns()[0]
+
+
+def fetch_parcels_with_columns() -> tuple[list[dict], dict[str, np.ndarray]]:
     try:
-        print("api base url:", API_BASE_URL)
-        with httpx.Client(base_url=API_BASE_URL) as client:
-            response = client.get("/parcels", params={"limit": 100})
-            response.raise_for_status()
-            data = response.json()
-            return data.get("parcels", [])
+        return _get_parcels()
     except Exception as e:
         st.error(f"Failed to fetch parcels: {e}")
-        return []
+        return [], _to_columns([])
 
 
-def fetch_parcel_details(parcel_id: str):
-    try:
-        with httpx.Client(base_url=API_BASE_URL) as client:
-            response = client.get(f"/{parcel_id}")
-            response.raise_for_status()
-            return response.json()
-    except Exception as e:
-        st.error(f"Failed to fetch parcel details: {e}")
-        return None
+def _post_parcels_batch(ids: list[str]) -> dict[str, dict]:
+    response = get_client().post("/parcels/batch", json={"ids": ids})
+    response.raise_for_status()
+    return {p["uid"]: p for p in orjson.loads(response.content)["parcels"]}
 
 
-def fetch_raw_stats(parcel_id: str):
-    try:
-        with httpx.Client(base_url=API_BASE_URL, timeout=30.0) as client:
-            response = client.get(f"/{parcel_id}/raw-stats")
-            response.raise_for_status()
-            return response.json()
-    except Exception as e:
-        st.error(f"Failed to fetch stats: {e}")
-        return []
+def _get_json(path: str, **kwargs):
+    response = get_client().get(path, **kwargs)
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
 
-def fetch_time_series(parcel_id: str, period: str = "weekly"):
-    """Fetch time series data for a parcel"""
-    try:
-        with httpx.Client(base_url=API_BASE_URL, timeout=30.0) as client:
-            response = client.get(f"/{parcel_id}/stats?period={period}")
-            response.raise_for_status()
-            return response.json()
-    except Exception as e:
-        st.error(f"Failed to fetch time series: {e}")
-        return []
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_raw_stats(parcel_id: str) -> dict:
+    return _get_json(f"/{parcel_id}/raw-stats", params={"limit": RAW_STATS_LIMIT})
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_time_series(parcel_id: str, period: str) -> dict:
+    return _get_json(
+        f"/{parcel_id}/stats",
+        params={"time_period": period, "limit": TIME_SERIES_LIMIT},
+    )
+
+
+def refresh_parcels():
+    """Drop cached API responses, the next rerun fetches everything again"""
+    _get_parcels.clear()
+    _get_raw_stats.clear()
+    _get_time_series.clear()
+    st.session_state.pop("parcels_by_id", None)
+
+
+def fetch_parcel_with_stats(
+    parcel_id: str, period: str = "weekly"
+) -> tuple[dict | None, dict, dict]:
+    """
+    Fetch a parcel with its raw stats and time series concurrently
+
+    Requests run in worker threads on the shared client, so the wait is the slowest
+    request instead of the sum. The parcel is only requested when it is not in the
+    session yet, stats responses are cached for 60s per (parcel, period).
+    The workers get the script run context so the cached calls run in this session,
+    errors are still reported from here.
+    """
+    cached = st.session_state.setdefault("parcels_by_id", {})
+    with ThreadPoolExecutor(
+        max_workers=3,
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx()),
+    ) as executor:
+        jobs = [
+            (executor.submit(_get_raw_stats, parcel_id), "stats"),
+            (executor.submit(_get_time_series, parcel_id, period), "time series"),
+        ]
+        if parcel_id not in cached:
+            details = executor.submit(_post_parcels_batch, [parcel_id])
+            jobs.append((details, "parcel details"))
+
+    results = []
+    for future, label in jobs:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            st.error(f"Failed to fetch {label}: {e}")
+            results.append({})
+    if len(results) > 2:
+        cached.update(results[2])
+    return cached.get(parcel_id), results[0], results[1]
 
 
 def create_parcel(parcel_data: dict):
     """Create a new parcel"""
     try:
-        with httpx.Client(base_url=API_BASE_URL, timeout=60.0) as client:
-            response = client.post("/parcels", json=parcel_data)
-            response.raise_for_status()
-            return response.json()
+        response = get_client().post("/parcels", json=parcel_data, timeout=60.0)
+        response.raise_for_status()
+        # the new parcel must show up in the list right away
+        _get_parcels.clear()
+        return orjson.loads(response.content)
     except Exception as e:
         st.error(f"Failed to create parcel: {e}")
         return None
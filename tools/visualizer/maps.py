@@ -1,19 +1,35 @@
 import folium
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+# boundaries with fewer vertices are cheap enough to send as is
+SIMPLIFY_MIN_VERTICES = 200
+# in degrees, about 1 m, well below what is visible at the parcel zoom level
+SIMPLIFY_TOLERANCE = 1e-5
+
+
+def exterior_coords(geometry) -> np.ndarray:
+    """Exterior ring (lon, lat) of a GeoJSON polygon, simplified when it is large"""
+    coords = np.asarray(geometry["coordinates"][0], dtype=np.float64)
+    if len(coords) < SIMPLIFY_MIN_VERTICES:
+        return coords
+    # Douglas-Peucker, fewer vertices means a smaller payload sent to the browser
+    simplified = shape(geometry).simplify(SIMPLIFY_TOLERANCE, preserve_topology=True)
+    return shapely.get_coordinates(simplified.exterior)
 
 
 def visualize_parcel_on_map(parcel_data):
     """Create a map showing the parcel boundary"""
-    coords = parcel_data["geometry"]["coordinates"][0]
-    latlon_coords = [(lat, lon) for lon, lat in coords]
-
-    lats = [lat for lat, _ in latlon_coords]
-    lons = [lon for _, lon in latlon_coords]
-    center = [sum(lats) / len(lats), sum(lons) / len(lons)]
+    # GeoJSON ring is (lon, lat), folium wants (lat, lon)
+    coords = exterior_coords(parcel_data["geometry"])
+    latlon_coords = coords[:, [1, 0]]
+    center = latlon_coords.mean(axis=0).tolist()
 
     m = folium.Map(location=center, zoom_start=16)
 
     folium.Polygon(
-        locations=latlon_coords,
+        locations=latlon_coords.tolist(),
         color="green",
         weight=2,
         fill=True,
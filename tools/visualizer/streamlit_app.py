@@ -1,14 +1,17 @@
+import math
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 from api import (
     create_parcel,
-    fetch_parcel_details,
+    fetch_parcel_with_stats,
     fetch_parcels,
-    fetch_raw_stats,
-    fetch_time_series,
+    fetch_parcels_with_columns,
+    refresh_parcels,
 )
-from maps import create_base_map, visualize_parcel_on_map
-from streamlit_folium import st_folium
+
+PARCELS_PER_PAGE = 20
 
 # Page configuration
 st.set_page_config(
@@ -60,27 +63,59 @@ def display_parcel_card(parcel):
                 st.session_state.selected_parcel = parcel["uid"]
                 st.rerun()
 
-        # Additional info
-        cols = st.columns(4)
-        with cols[0]:
-            st.caption(f"**Soil:** {parcel.get('soil_type', 'N/A')}")
-        with cols[1]:
-            st.caption(f"**Irrigation:** {parcel.get('irrigation_type', 'N/A')}")
-        with cols[2]:
-            if parcel.get("latest_acquisition_date"):
-                st.caption(f"**Latest Data:** {parcel['latest_acquisition_date']}")
-        with cols[3]:
-            status = "🟢 Active" if parcel.get("is_active") else "🔴 Inactive"
-            st.caption(f"**Status:** {status}")
+        # Additional info, one element instead of a column and caption per field
+        info = [
+            f"**Soil:** {parcel.get('soil_type', 'N/A')}",
+            f"**Irrigation:** {parcel.get('irrigation_type', 'N/A')}",
+        ]
+        if parcel.get("latest_acquisition_date"):
+            info.append(f"**Latest Data:** {parcel['latest_acquisition_date']}")
+        status = "🟢 Active" if parcel.get("is_active") else "🔴 Inactive"
+        info.append(f"**Status:** {status}")
+        st.caption(" &nbsp;|&nbsp; ".join(info), unsafe_allow_html=True)
 
         st.markdown("---")
 
 
+# folium maps are rebuilt only when their inputs change, not on every rerun.
+# cache_resource shares the map instead of copying it (folium maps don't pickle).
+# folium and streamlit_folium are imported where maps are drawn, pages without
+# a map don't load them
+@st.cache_resource(max_entries=32)
+def cached_base_map(lat, lon, zoom):
+    from maps import create_base_map
+
+    return create_base_map(center=[lat, lon], zoom=zoom)
+
+
+@st.cache_resource(max_entries=32)
+def cached_parcel_map(parcel_id, updated_at, _parcel):
+    # the boundary can only change with updated_at, the parcel itself is not hashed
+    from maps import visualize_parcel_on_map
+
+    return visualize_parcel_on_map(_parcel)
+
+
+# same TTL as the API responses the frames are built from
+@st.cache_data(ttl=60, show_spinner=False)
+def time_series_frames(parcel_id, period, _stats):
+    """Typed time series frame and its chart frame, built once per (parcel, period)"""
+    df_ts = pd.DataFrame(_stats).astype({"value": "float32", "is_anomaly": "bool"})
+    df_ts["start_date"] = pd.to_datetime(df_ts["start_date"])
+    df_ts.sort_values("start_date", inplace=True)
+    chart_df = df_ts.set_index("start_date")[["value"]]
+    return df_ts, chart_df
+
+
 # ========== PAGE ROUTING ==========
 
 if page == "Dashboard":
     st.header("Your Parcels")
 
+    if st.button("🔄 Refresh"):
+        refresh_parcels()
+        time_series_frames.clear()
+
     # Back button if viewing details
     if st.session_state.selected_parcel:
         if st.button("← Back to all parcels"):
@@ -89,7 +124,11 @@ if page == "Dashboard":
 
         # Show parcel details
         parcel_id = st.session_state.selected_parcel
-        parcel = fetch_parcel_details(parcel_id)
+        # the period widget below keeps its value in session state, so the
+        # parcel and both tabs' data can be requested together before rendering
+        period = st.session_state.get("ts_period", "weekly")
+        with st.spinner("Loading parcel..."):
+            parcel, raw_stats, ts_data = fetch_parcel_with_stats(parcel_id, period)
 
         if parcel:
             st.markdown(f"## {parcel['name']}")
@@ -113,17 +152,21 @@ if page == "Dashboard":
 
             with tab1:
                 st.subheader("Raw NDVI Statistics")
-                with st.spinner("Loading raw statistics..."):
-                    raw_stats = fetch_raw_stats(parcel_id)
-                    stats = raw_stats.get("stats")
+                stats = raw_stats.get("stats")
                 if stats:
                     # Convert to DataFrame for easy display
                     df = pd.DataFrame(stats)
-                    # Sort by date
+                    # smaller dtypes, smaller Arrow payload sent to the browser
+                    stat_cols = ["mean_value", "min_value", "max_value", "std_dev"]
+                    df[stat_cols] = df[stat_cols].astype("float32")
+                    df["metric_type"] = df["metric_type"].astype("category")
                     df["acquisition_date"] = pd.to_datetime(df["acquisition_date"])
-                    df = df.sort_values("acquisition_date", ascending=False)
 
-                    st.write(f"**Total observations:** {len(df)}")
+                    # rows come newest first, capped at the limit requested in api.py
+                    total = raw_stats.get("total") or len(df)
+                    st.write(f"**Total observations:** {total}")
+                    if total > len(df):
+                        st.caption(f"Showing the latest {len(df)} observations")
 
                     # Display table
                     st.dataframe(
@@ -158,16 +201,17 @@ if page == "Dashboard":
 
                 # Period selector
                 period = st.selectbox(
-                    "Select time period", ["weekly", "monthly"], index=0
+                    "Select time period",
+                    ["weekly", "monthly"],
+                    index=0,
+                    key="ts_period",
                 )
 
-                with st.spinner(f"Loading {period} time series..."):
-                    ts_data = fetch_time_series(parcel_id, period)
-                    stats = ts_data.get("stats")
+                stats = ts_data.get("stats")
                 if stats:
-                    df_ts = pd.DataFrame(stats)
-                    df_ts["start_date"] = pd.to_datetime(df_ts["start_date"])
-                    df_ts = df_ts.sort_values("start_date")
+                    # every widget below reuses the frames and the mask
+                    df_ts, chart_df = time_series_frames(parcel_id, period, stats)
+                    anomaly_mask = df_ts["is_anomaly"].to_numpy(dtype=bool)
 
                     # Metrics
                     col1, col2, col3 = st.columns(3)
@@ -175,7 +219,7 @@ if page == "Dashboard":
                         avg_value = df_ts["value"].mean()
                         st.metric("Average NDVI", f"{avg_value:.3f}")
                     with col2:
-                        anomaly_count = df_ts["is_anomaly"].sum()
+                        anomaly_count = int(anomaly_mask.sum())
                         st.metric("Anomalies Detected", anomaly_count)
                     with col3:
                         latest_change = df_ts.iloc[-1]["change_from_previous"]
@@ -191,11 +235,10 @@ if page == "Dashboard":
                     # Time series chart with anomalies highlighted
                     st.subheader(f"{period.capitalize()} NDVI Trend")
 
-                    chart_df = df_ts[["start_date", "value"]].set_index("start_date")
                     st.line_chart(chart_df)
 
                     # Highlight anomalies
-                    anomalies = df_ts[df_ts["is_anomaly"] == True]  # noqa
+                    anomalies = df_ts.iloc[np.flatnonzero(anomaly_mask)]
                     if not anomalies.empty:
                         st.warning(f"⚠️ {len(anomalies)} anomalies detected:")
                         st.dataframe(
@@ -204,22 +247,32 @@ if page == "Dashboard":
                             hide_index=True,
                         )
 
-                    # Full data table
-                    with st.expander("View full time series data"):
-                        st.dataframe(df_ts, use_container_width=True, hide_index=True)
+                    # Full data table, only sent to the browser when asked for.
+                    # An expander would serialize it on every rerun, even closed
+                    if st.toggle("View full time series data", key="ts_show_full"):
+                        total = ts_data.get("total") or len(df_ts)
+                        if total > len(df_ts):
+                            st.caption(f"Latest {len(df_ts)} of {total} periods")
+                        st.dataframe(
+                            df_ts,
+                            use_container_width=True,
+                            hide_index=True,
+                        )
                 else:
                     st.info("No time series data available yet.")
 
             with tab3:
+                from streamlit_folium import st_folium
+
                 st.subheader("Parcel Location")
                 # Display map with parcel boundary
-                m = visualize_parcel_on_map(parcel)
+                m = cached_parcel_map(parcel["uid"], parcel.get("updated_at"), parcel)
                 st_folium(m, width=700, height=500)
 
     else:
         # Show all parcels list
         with st.spinner("Loading parcels..."):
-            parcels = fetch_parcels()
+            parcels, columns = fetch_parcels_with_columns()
 
         if not parcels:
             st.info("No parcels found. Create your first parcel to get started!")
@@ -232,45 +285,61 @@ if page == "Dashboard":
             with col1:
                 st.metric("Total Parcels", len(parcels))
             with col2:
-                active_count = sum(1 for p in parcels if p.get("is_active"))
-                st.metric("Active", active_count)
+                st.metric("Active", int(columns["is_active"].sum()))
             with col3:
-                total_area = sum(p.get("area_hectares", 0) for p in parcels)
-                st.metric("Total Area", f"{total_area:.2f} ha")
+                st.metric("Total Area", f"{columns['area_hectares'].sum():.2f} ha")
             with col4:
-                with_data = sum(1 for p in parcels if p.get("latest_acquisition_date"))
-                st.metric("With Data", with_data)
+                st.metric("With Data", int(columns["has_data"].sum()))
 
             st.markdown("---")
 
-            # Filter options
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                search = st.text_input(
-                    "🔍 Search parcels", placeholder="Enter parcel name..."
-                )
-            with col2:
-                show_inactive = st.checkbox("Show inactive", value=False)
-
-            # Filter parcels
-            filtered_parcels = parcels
-            if search:
-                filtered_parcels = [
-                    p
-                    for p in filtered_parcels
-                    if search.lower() in p.get("name", "").lower()
-                ]
+            # Filter options, in a form so the list is only filtered and
+            # re-rendered on Apply, not on every edit
+            with st.form("filter_form"):
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    search = st.text_input(
+                        "🔍 Search parcels",
+                        placeholder="Enter parcel name...",
+                        key="search",
+                    )
+                with col2:
+                    show_inactive = st.checkbox(
+                        "Show inactive", value=False, key="show_inactive"
+                    )
+                st.form_submit_button("Apply")
+
+            # Filter parcels on the column arrays, only the matching
+            # positions are looked up in the list
+            mask = np.ones(len(parcels), dtype=bool)
             if not show_inactive:
-                filtered_parcels = [p for p in filtered_parcels if p.get("is_active")]
+                mask &= columns["is_active"]
+            search_lc = search.lower()
+            if search_lc:
+                mask &= np.char.find(columns["name_lc"], search_lc) >= 0
+            filtered_idx = np.flatnonzero(mask)
 
             # Display parcels
-            if filtered_parcels:
-                for parcel in filtered_parcels:
-                    display_parcel_card(parcel)
+            if filtered_idx.size:
+                # bounded number of cards (and widgets) per rerun
+                page_count = math.ceil(filtered_idx.size / PARCELS_PER_PAGE)
+                page_num = 1
+                if page_count > 1:
+                    page_num = st.number_input(
+                        f"Page (of {page_count})",
+                        min_value=1,
+                        max_value=page_count,
+                        value=1,
+                    )
+                start = (page_num - 1) * PARCELS_PER_PAGE
+                for i in filtered_idx[start : start + PARCELS_PER_PAGE]:
+                    display_parcel_card(parcels[i])
             else:
                 st.warning("No parcels match your filters.")
 
 elif page == "Create Parcel":
+    from streamlit_folium import st_folium
+
     st.header("Create New Parcel")
 
     st.markdown("""
@@ -294,7 +363,8 @@ elif page == "Create Parcel":
         except:  # noqa
             lat, lon = -1.9441, 30.0619
 
-        m = create_base_map(center=[lat, lon], zoom=12)
+        # ~10 m precision, centers typed with extra decimals reuse the same map
+        m = cached_base_map(round(lat, 4), round(lon, 4), 12)
         output = st_folium(m, width=700, height=500, key="map")
 
     with col2:
@@ -412,47 +482,52 @@ elif page == "Analytics":
     else:
         st.subheader("Fleet Overview")
 
+        # one columnar frame for all the aggregates below, missing fields become NaN
+        pdf = pd.DataFrame(parcels).reindex(
+            columns=[
+                "name",
+                "area_hectares",
+                "auto_sync_enabled",
+                "crop_type",
+                "last_data_synced_at",
+            ]
+        )
+
         # Overall metrics
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            total_parcels = len(parcels)
+            total_parcels = len(pdf)
             st.metric("Total Parcels", total_parcels)
+        # one float64 array for every area reduction, missing areas count as 0
+        areas = pdf["area_hectares"].to_numpy(dtype=np.float64, na_value=0.0)
         with col2:
-            total_area = sum(p.get("area_hectares", 0) for p in parcels)
-            st.metric("Total Area", f"{total_area:.2f} ha")
+            st.metric("Total Area", f"{areas.sum():.2f} ha")
         with col3:
-            avg_area = total_area / total_parcels if total_parcels > 0 else 0
-            st.metric("Avg Parcel Size", f"{avg_area:.2f} ha")
+            st.metric("Avg Parcel Size", f"{areas.mean():.2f} ha")
         with col4:
-            active_monitoring = sum(1 for p in parcels if p.get("auto_sync_enabled"))
+            active_monitoring = int(
+                pdf["auto_sync_enabled"].fillna(False).astype(bool).sum()
+            )
             st.metric("Auto-Sync Enabled", active_monitoring)
 
         st.markdown("---")
 
         # Crop distribution
         st.subheader("Crop Distribution")
-        crop_counts = {}
-        for p in parcels:
-            crop = p.get("crop_type") or "Unknown"
-            crop_counts[crop] = crop_counts.get(crop, 0) + 1
-
-        if crop_counts:
-            df_crops = pd.DataFrame(
-                list(crop_counts.items()), columns=["Crop", "Count"]
-            )
-            st.bar_chart(df_crops.set_index("Crop"))
+        crop_counts = pdf["crop_type"].fillna("").replace("", "Unknown").value_counts()
+        if not crop_counts.empty:
+            st.bar_chart(crop_counts.rename_axis("Crop").rename("Count"))
 
         # Recent activity
         st.subheader("Recent Data Updates")
-        recent = sorted(
-            [p for p in parcels if p.get("last_data_synced_at")],
-            key=lambda x: x["last_data_synced_at"],
-            reverse=True,
-        )[:5]
-
-        if recent:
-            for p in recent:
-                st.write(f"**{p['name']}** - Last synced: {p['last_data_synced_at']}")
+        # top 5 by partial selection instead of sorting every parcel,
+        # parcels never synced are NaT and left out by nlargest
+        synced_at = pd.to_datetime(pdf["last_data_synced_at"], utc=True)
+        recent = pdf.loc[synced_at.nlargest(5).index]
+
+        if not recent.empty:
+            for p in recent.itertuples(index=False):
+                st.write(f"**{p.name}** - Last synced: {p.last_data_synced_at}")
         else:
             st.info("No recent data syncs recorded.")
 